@@ -1,14 +1,22 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
+from threading import Lock
 import uvicorn
+import time
 import os
 import sys
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from main import run_query
-from tools.graph_query_tool import get_graph_schema_info
+from tools.graph_query_tool import get_graph_schema_info, get_query_metrics
+
+# Seconds the graph schema metadata is cached before it is reloaded from Neo4j
+SCHEMA_CACHE_TTL_SECONDS = float(os.getenv("schema_cache_ttl_seconds", "300"))
+
+_schema_cache = {"info": None, "loaded_at": 0.0}
+_schema_cache_lock = Lock()
 
 app = FastAPI(
     title="Movie AI Agent API",
@@ -35,6 +43,23 @@ class GraphInfoResponse(BaseModel):
     relationship_types: list
     property_keys: list
 
+class QueryMetricsResponse(BaseModel):
+    executed: int
+    rejected: int
+    timed_out: int
+    auto_limited: int
+    failed: int
+
+
+def get_cached_schema_info():
+    """Return schema metadata, reloading it from Neo4j once the TTL has expired"""
+    with _schema_cache_lock:
+        now = time.monotonic()
+        if _schema_cache["info"] is None or now - _schema_cache["loaded_at"] >= SCHEMA_CACHE_TTL_SECONDS:
+            _schema_cache["info"] = get_graph_schema_info()
+            _schema_cache["loaded_at"] = now
+
+        return _schema_cache["info"]
 
 
 @app.get("/")
@@ -61,7 +86,7 @@ async def ask_endpoint(payload: AskRequest):
 
 
 @app.get("/graph-info", response_model=GraphInfoResponse)
-async def graph_info():
+def graph_info():
     """
     Returns metadata about the Neo4j graph:
     - node labels
@@ -69,7 +94,7 @@ async def graph_info():
     - properties
     """
     try:
-        info = get_graph_schema_info()
+        info = get_cached_schema_info()
         
         return GraphInfoResponse(
             node_labels=info["node_labels"],
@@ -80,5 +105,14 @@ async def graph_info():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/metrics", response_model=QueryMetricsResponse)
+async def metrics():
+    """
+    Returns counters for agent-generated Cypher queries:
+    - executed, rejected, timed out, auto-limited and failed
+    """
+    return QueryMetricsResponse(**get_query_metrics())
+
+
 if __name__ == "__main__":
     uvicorn.run("api:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
@@ -0,0 +1,56 @@
+import streamlit as st
+import requests
+from requests.adapters import HTTPAdapter
+
+# API Configuration
+API_URL = "http://localhost:8000"
+
+HEALTH_TTL_SECONDS = 15
+# Kept short: the API caches the schema itself (schema_cache_ttl_seconds)
+GRAPH_INFO_TTL_SECONDS = HEALTH_TTL_SECONDS
+
+
+@st.cache_resource
+def get_session():
+    """
+    HTTP session with a connection pool, deliberately shared by every
+    Streamlit session and script thread so connections are reused across
+    reruns and users. It holds no cookies or auth state; only the pooled
+    HTTPAdapter is relied on for concurrent use.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@st.cache_data(ttl=HEALTH_TTL_SECONDS, show_spinner=False)
+def _fetch_health_status():
+    """Raises when the API is unreachable so that failures are not cached"""
+    return get_session().get(f"{API_URL}/", timeout=2).status_code
+
+
+def check_health():
+    """Return the health check status code (None if unreachable), cached between reruns"""
+    try:
+        return _fetch_health_status()
+    except requests.exceptions.RequestException:
+        return None
+
+
+@st.cache_data(ttl=GRAPH_INFO_TTL_SECONDS, show_spinner=False)
+def get_graph_info():
+    """Fetch graph metadata from the API; raises on failure so errors are not cached"""
+    response = get_session().get(f"{API_URL}/graph-info", timeout=10)
+    response.raise_for_status()
+    return response.json()
+
+
+def ask(query: str):
+    """Send a question to the agent and return the raw response"""
+    return get_session().post(
+        f"{API_URL}/ask",
+        json={"query": query},
+        timeout=30
+    )
@@ -2,8 +2,7 @@ import streamlit as st
 import requests
 import json
 
-# API Configuration
-API_URL = "http://localhost:8000"
+from api_client import ask, check_health, get_graph_info
 
 st.set_page_config(page_title="Movie AI Agent", page_icon="🎬", layout="wide")
 
@@ -31,13 +30,12 @@ with st.sidebar:
     st.header("⚙️ Settings")
     
     # API Status Check
-    try:
-        response = requests.get(f"{API_URL}/", timeout=2)
-        if response.status_code == 200:
-            st.success("✅ API Connected")
-        else:
-            st.error("❌ API Error")
-    except:
+    status_code = check_health()
+    if status_code == 200:
+        st.success("✅ API Connected")
+    elif status_code is not None:
+        st.error("❌ API Error")
+    else:
         st.error("❌ API Not Running")
         st.info("Run: `python api.py`")
     
@@ -46,12 +44,9 @@ with st.sidebar:
     # Show Graph Info
     if st.button("📊 Show Database Info"):
         try:
-            response = requests.get(f"{API_URL}/graph-info")
-            if response.status_code == 200:
-                data = response.json()
-                st.json(data)
-            else:
-                st.error("Failed to fetch graph info")
+            st.json(get_graph_info())
+        except requests.exceptions.HTTPError:
+            st.error("Failed to fetch graph info")
         except Exception as e:
             st.error(f"Error: {str(e)}")
     
@@ -94,11 +89,7 @@ if submit and query:
     
     with st.spinner("🤖 AI Agent is thinking..."):
         try:
-            response = requests.post(
-                f"{API_URL}/ask",
-                json={"query": query},
-                timeout=30
-            )
+            response = ask(query)
             
             if response.status_code == 200:
                 data = response.json()
@@ -0,0 +1,63 @@
+import os
+
+import pytest
+
+for module in ("fastapi", "neo4j", "dotenv", "langchain_core", "langgraph", "langchain_groq", "transformers", "torch"):
+    pytest.importorskip(module)
+
+# main.py builds the Groq client at import time; no request is sent in these tests
+os.environ.setdefault("groq_api_key", "test-key")
+
+from backend import api
+
+SCHEMA = {"node_labels": ["movie"], "relationship_types": ["DIRECTED"], "property_keys": ["title"]}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fresh schema cache with a controllable monotonic clock"""
+    monkeypatch.setitem(api._schema_cache, "info", None)
+    monkeypatch.setitem(api._schema_cache, "loaded_at", 0.0)
+    monkeypatch.setattr(api, "SCHEMA_CACHE_TTL_SECONDS", 300)
+    now = {"value": 1000.0}
+    monkeypatch.setattr(api.time, "monotonic", lambda: now["value"])
+    return now
+
+
+def _count_loads(monkeypatch, *results):
+    loads = []
+
+    def fake_schema_info():
+        result = results[len(loads)]
+        loads.append(result)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    monkeypatch.setattr(api, "get_graph_schema_info", fake_schema_info)
+    return loads
+
+
+def test_schema_loaded_once_within_ttl(clock, monkeypatch):
+    loads = _count_loads(monkeypatch, SCHEMA)
+    assert api.get_cached_schema_info() == SCHEMA
+    clock["value"] += 299
+    assert api.get_cached_schema_info() == SCHEMA
+    assert len(loads) == 1
+
+
+def test_schema_reloaded_after_ttl(clock, monkeypatch):
+    updated = dict(SCHEMA, node_labels=["movie", "person"])
+    loads = _count_loads(monkeypatch, SCHEMA, updated)
+    assert api.get_cached_schema_info() == SCHEMA
+    clock["value"] += 300
+    assert api.get_cached_schema_info() == updated
+    assert len(loads) == 2
+
+
+def test_schema_load_error_is_not_cached(clock, monkeypatch):
+    loads = _count_loads(monkeypatch, RuntimeError("neo4j down"), SCHEMA)
+    with pytest.raises(RuntimeError):
+        api.get_cached_schema_info()
+    assert api.get_cached_schema_info() == SCHEMA
+    assert len(loads) == 2
@@ -0,0 +1,100 @@
+from tools.cypher_guard import apply_result_limit, has_limit, max_estimated_rows, normalize_query
+
+
+def _plan(rows, operator="ProduceResults@neo4j", children=None):
+    return {"operatorType": operator, "args": {"EstimatedRows": rows}, "children": children or []}
+
+
+def _limit(cypher, plan, limit=100):
+    query, masked = normalize_query(cypher)
+    return apply_result_limit(query, masked, plan, limit)
+
+
+def test_has_limit_trailing():
+    _, masked = normalize_query("MATCH (m:movie) RETURN m LIMIT 5")
+    assert has_limit(masked)
+
+
+def test_has_limit_followed_by_comment():
+    _, masked = normalize_query("MATCH (m:movie) RETURN m LIMIT 5 // top five\n")
+    assert has_limit(masked)
+
+
+def test_has_limit_lowercase():
+    _, masked = normalize_query("match (m:movie) return m limit 5;")
+    assert has_limit(masked)
+
+
+def test_has_limit_ignores_subquery_and_strings():
+    _, masked = normalize_query("CALL { MATCH (m:movie) RETURN m LIMIT 1 } RETURN m")
+    assert not has_limit(masked)
+    _, masked = normalize_query("MATCH (m:movie {title: 'LIMIT 5'}) RETURN m")
+    assert not has_limit(masked)
+
+
+def test_has_limit_ignores_limit_as_alias_or_property():
+    _, masked = normalize_query("MATCH (m:movie) RETURN m.title AS limit")
+    assert not has_limit(masked)
+    _, masked = normalize_query("MATCH (m:movie) RETURN m ORDER BY m.limit")
+    assert not has_limit(masked)
+
+
+def test_has_limit_ignores_collect_subquery():
+    _, masked = normalize_query("MATCH (m:movie) RETURN m, COLLECT { MATCH (m)--(p) RETURN p LIMIT 3 } AS ps")
+    assert not has_limit(masked)
+
+
+def test_apply_result_limit_after_limit_lookalikes():
+    for cypher in (
+        "MATCH (m:movie) RETURN m.title AS limit",
+        "MATCH (m:movie) RETURN m ORDER BY m.limit",
+        "MATCH (m:movie) RETURN m, COLLECT { MATCH (m)--(p) RETURN p LIMIT 3 } AS ps",
+    ):
+        query, action = _limit(cypher, _plan(5000))
+        assert action == "limited"
+        assert query == f"{cypher} LIMIT 100"
+
+
+def test_max_estimated_rows_nested_plan():
+    plan = _plan(10, children=[_plan(50, "Filter", [_plan(1e8, "CartesianProduct")])])
+    assert max_estimated_rows(plan) == 1e8
+
+
+def test_max_estimated_rows_no_plan():
+    assert max_estimated_rows(None) == 0
+
+
+def test_normalize_strips_comments_and_semicolon():
+    query, _ = normalize_query("MATCH (m:movie) /* all */ RETURN m; // done")
+    assert query == "MATCH (m:movie)   RETURN m"
+
+
+def test_normalize_keeps_comment_markers_inside_strings():
+    query, _ = normalize_query("MATCH (m {url: 'http://x.org'}) RETURN m")
+    assert query == "MATCH (m {url: 'http://x.org'}) RETURN m"
+
+
+def test_normalize_strips_explain_profile_and_cypher_prefix():
+    assert normalize_query("EXPLAIN MATCH (m) RETURN m")[0] == "MATCH (m) RETURN m"
+    assert normalize_query("profile MATCH (m) RETURN m")[0] == "MATCH (m) RETURN m"
+    assert normalize_query("CYPHER runtime=slotted EXPLAIN MATCH (m) RETURN m")[0] == "MATCH (m) RETURN m"
+
+
+def test_apply_result_limit_appends_after_comment():
+    query, action = _limit("MATCH (m:movie) RETURN m // every movie", _plan(5000))
+    assert action == "limited"
+    assert query == "MATCH (m:movie) RETURN m LIMIT 100"
+
+
+def test_apply_result_limit_keeps_small_or_limited_queries():
+    assert _limit("MATCH (m:movie) RETURN m", _plan(10))[1] == "none"
+    assert _limit("MATCH (m:movie) RETURN m limit 500", _plan(500))[1] == "none"
+
+
+def test_apply_result_limit_rejects_union():
+    cypher = "MATCH (m:movie) RETURN m.title AS t UNION MATCH (p:person) RETURN p.name AS t"
+    assert _limit(cypher, _plan(5000))[1] == "rejected"
+
+
+def test_apply_result_limit_rejects_standalone_call():
+    assert _limit("CALL db.propertyKeys()", _plan(5000))[1] == "rejected"
@@ -0,0 +1,155 @@
+import json
+
+import pytest
+
+pytest.importorskip("neo4j")
+pytest.importorskip("langchain_core")
+pytest.importorskip("dotenv")
+
+from neo4j.exceptions import ClientError
+
+from tools import graph_query_tool
+
+
+def _plan(rows, operator="ProduceResults@neo4j"):
+    return {"operatorType": operator, "args": {"EstimatedRows": rows}, "children": []}
+
+
+def _client_error(code):
+    # Subclass so the error code is set the same way on every driver version
+    return type("FakeClientError", (ClientError,), {"code": code})(code)
+
+
+class FakeSession:
+    def __init__(self, query_type="r", plan=None, rows=None, error=None):
+        self.query_type = query_type
+        self.plan = plan or _plan(1)
+        self.rows = rows or []
+        self.error = error
+        self.fetched = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute_read(self, work, cypher_query):
+        if work is graph_query_tool._explain:
+            return self.query_type, self.plan
+        self.fetched.append(cypher_query)
+        if self.error:
+            raise self.error
+        return self.rows
+
+
+class FakeDriver:
+    def __init__(self, session):
+        self._session = session
+        self.closed = False
+
+    def session(self, **kwargs):
+        return self._session
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def run(monkeypatch):
+    """Run the query tool against a fake driver; returns (parsed output, session, metrics delta)"""
+    for metric in graph_query_tool._metrics:
+        monkeypatch.setitem(graph_query_tool._metrics, metric, 0)
+
+    def _run(cypher, **session_kwargs):
+        session = FakeSession(**session_kwargs)
+        driver = FakeDriver(session)
+        monkeypatch.setattr(graph_query_tool.GraphDatabase, "driver", lambda *args, **kwargs: driver)
+        output = graph_query_tool.query.invoke({"cypher_query": cypher})
+        assert driver.closed
+        try:
+            output = json.loads(output)
+        except json.JSONDecodeError:
+            pass
+        return output, session, graph_query_tool.get_query_metrics()
+
+    return _run
+
+
+def test_write_query_is_rejected(run):
+    output, session, metrics = run("CREATE (m:movie {title: 'x'})", query_type="w")
+    assert output["reason"] == "write_not_allowed"
+    assert output["hint"]
+    assert session.fetched == []
+    assert metrics["rejected"] == 1
+    assert metrics["executed"] == 0
+
+
+def test_expensive_plan_is_rejected(run, monkeypatch):
+    monkeypatch.setattr(graph_query_tool, "QUERY_MAX_ESTIMATED_ROWS", 1000)
+    output, session, metrics = run("MATCH (a), (b) RETURN a, b LIMIT 5", plan=_plan(5000))
+    assert output["reason"] == "too_expensive"
+    assert output["estimated_rows"] == 5000
+    assert session.fetched == []
+    assert metrics["rejected"] == 1
+
+
+def test_timeout_is_reported_and_counted(run):
+    error = _client_error(graph_query_tool.TIMEOUT_ERROR_CODES[0])
+    output, _, metrics = run("MATCH (m:movie) RETURN m LIMIT 5", error=error)
+    assert output["reason"] == "timeout"
+    assert output["hint"]
+    assert metrics["timed_out"] == 1
+    assert metrics["executed"] == 0
+
+
+def test_access_mode_error_is_rejected_with_hint(run):
+    error = _client_error("Neo.ClientError.Statement.AccessMode")
+    output, _, metrics = run("MATCH (m:movie) RETURN m LIMIT 5", error=error)
+    assert output["reason"] == "write_not_allowed"
+    assert output["hint"] == graph_query_tool.WRITE_NOT_ALLOWED_HINT
+    assert metrics["rejected"] == 1
+
+
+def test_other_client_error_is_counted_as_failed(run):
+    output, _, metrics = run("MATCH (m:movie) RETURN m LIMIT 5", error=_client_error("Neo.ClientError.Statement.SyntaxError"))
+    assert "error" in output
+    assert metrics["failed"] == 1
+
+
+def test_auto_limit_reports_truncation(run, monkeypatch):
+    monkeypatch.setattr(graph_query_tool, "QUERY_RESULT_LIMIT", 2)
+    rows = [{"title": "A"}, {"title": "B"}]
+    output, session, metrics = run("MATCH (m:movie) RETURN m.title AS title", plan=_plan(5000), rows=rows)
+    assert session.fetched == ["MATCH (m:movie) RETURN m.title AS title LIMIT 2"]
+    assert output["rows"] == rows
+    assert output["truncated"] is True
+    assert output["limit"] == 2
+    assert output["hint"]
+    assert metrics["auto_limited"] == 1
+    assert metrics["executed"] == 1
+
+
+def test_auto_limit_not_filled_returns_plain_rows(run, monkeypatch):
+    monkeypatch.setattr(graph_query_tool, "QUERY_RESULT_LIMIT", 2)
+    rows = [{"title": "A"}]
+    output, _, metrics = run("MATCH (m:movie) RETURN m.title AS title", plan=_plan(5000), rows=rows)
+    assert output == rows
+    assert metrics["auto_limited"] == 1
+
+
+def test_unbounded_union_is_rejected(run, monkeypatch):
+    monkeypatch.setattr(graph_query_tool, "QUERY_RESULT_LIMIT", 2)
+    cypher = "MATCH (m:movie) RETURN m.title AS t UNION MATCH (p:person) RETURN p.name AS t"
+    output, session, metrics = run(cypher, plan=_plan(5000))
+    assert output["reason"] == "unbounded_result"
+    assert session.fetched == []
+    assert metrics["rejected"] == 1
+
+
+def test_small_query_runs_unchanged(run):
+    rows = [{"title": "Supernatural"}]
+    output, session, metrics = run("MATCH (m:movie {title: 'Supernatural'}) RETURN m.title AS title;", rows=rows)
+    assert session.fetched == ["MATCH (m:movie {title: 'Supernatural'}) RETURN m.title AS title"]
+    assert output == rows
+    assert metrics == {"executed": 1, "rejected": 0, "timed_out": 0, "auto_limited": 0, "failed": 0}
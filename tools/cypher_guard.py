@@ -0,0 +1,135 @@
+# tools/cypher_guard.py
+import re
+
+_PREFIX_PATTERN = re.compile(
+    r"^\s*(?:EXPLAIN\b|PROFILE\b|CYPHER\b(?:\s+(?:\d+(?:\.\d+)?|\w+\s*=\s*\w+))*)",
+    re.IGNORECASE,
+)
+
+
+def _scan(cypher_query: str):
+    """
+    Remove comments from a query.
+    Returns the cleaned query and a masked copy of the same length where
+    string literals and backtick identifiers are blanked out, so keyword
+    searches never match text inside them.
+    """
+    cleaned, masked = [], []
+    quote = None
+    i = 0
+    while i < len(cypher_query):
+        char = cypher_query[i]
+        if quote:
+            if char == "\\" and quote != "`" and i + 1 < len(cypher_query):
+                cleaned.append(cypher_query[i:i + 2])
+                masked.append("xx")
+                i += 2
+                continue
+            cleaned.append(char)
+            masked.append(char if char == quote else "x")
+            if char == quote:
+                quote = None
+        elif char in "'\"`":
+            quote = char
+            cleaned.append(char)
+            masked.append(char)
+        elif cypher_query.startswith("//", i):
+            end = cypher_query.find("\n", i)
+            i = len(cypher_query) if end == -1 else end
+            continue
+        elif cypher_query.startswith("/*", i):
+            end = cypher_query.find("*/", i + 2)
+            i = len(cypher_query) if end == -1 else end + 2
+            cleaned.append(" ")
+            masked.append(" ")
+            continue
+        else:
+            cleaned.append(char)
+            masked.append(char)
+        i += 1
+    return "".join(cleaned), "".join(masked)
+
+
+def normalize_query(cypher_query: str):
+    """
+    Strip comments, a trailing ';' and any leading EXPLAIN/PROFILE/CYPHER
+    prefix so the guard can safely prepend EXPLAIN or append LIMIT.
+    Returns the normalized query and its masked copy.
+    """
+    cleaned, masked = _scan(cypher_query)
+
+    while True:
+        match = _PREFIX_PATTERN.match(masked)
+        if not match or not match.group(0).strip():
+            break
+        cleaned, masked = cleaned[match.end():], masked[match.end():]
+
+    start = len(masked) - len(masked.lstrip())
+    end = len(masked.rstrip().rstrip(";").rstrip())
+    return cleaned[start:end], masked[start:end]
+
+
+def _top_level(masked_query: str, keyword: str):
+    """Matches of a keyword outside any {...} subquery, map or pattern"""
+    depths, depth = [], 0
+    for char in masked_query:
+        if char == "}":
+            depth -= 1
+        depths.append(depth)
+        if char == "{":
+            depth += 1
+    return [
+        match for match in re.finditer(rf"\b{keyword}\b", masked_query, re.IGNORECASE)
+        if depths[match.start()] == 0
+    ]
+
+
+def has_limit(masked_query: str) -> bool:
+    """True if the final top-level RETURN clause already has a LIMIT"""
+    returns = _top_level(masked_query, "RETURN")
+    if not returns:
+        return False
+    final_return = returns[-1].end()
+    for match in _top_level(masked_query, "LIMIT"):
+        if match.start() < final_return:
+            continue
+        before = masked_query[:match.start()].rstrip()
+        after = masked_query[match.end():].lstrip()
+        # Skip property accesses (m.limit), aliases (AS limit) and bare variables (RETURN m, limit)
+        if before.endswith(".") or re.search(r"\bAS$", before, re.IGNORECASE):
+            continue
+        if not after or after[0] in ",)":
+            continue
+        return True
+    return False
+
+
+def max_estimated_rows(plan) -> float:
+    """Largest row estimate of any operator in an EXPLAIN plan tree"""
+    if not plan:
+        return 0
+    estimate = plan.get("args", {}).get("EstimatedRows", 0)
+    children = plan.get("children", [])
+    return max([estimate] + [max_estimated_rows(child) for child in children])
+
+
+def apply_result_limit(cypher_query: str, masked_query: str, plan, limit: int):
+    """
+    Decide how to bound the result of a normalized query.
+    Returns (query, action) where action is:
+    - "none": the query already returns few enough rows or has a LIMIT
+    - "limited": a LIMIT was appended to the query
+    - "rejected": the result is unbounded but the query can't be safely rewritten
+      (top-level UNION, no top-level RETURN, or a plan whose root isn't ProduceResults)
+    """
+    result_rows = plan.get("args", {}).get("EstimatedRows", 0) if plan else 0
+    if result_rows <= limit or has_limit(masked_query):
+        return cypher_query, "none"
+
+    root_operator = plan.get("operatorType", "")
+    returns_rows = bool(_top_level(masked_query, "RETURN"))
+    is_union = bool(_top_level(masked_query, "UNION"))
+    if is_union or not returns_rows or not root_operator.startswith("ProduceResults"):
+        return cypher_query, "rejected"
+
+    return f"{cypher_query} LIMIT {limit}", "limited"
@@ -1,15 +1,70 @@
 # tools/graph_query_tool.py
-from neo4j import GraphDatabase
+from neo4j import GraphDatabase, READ_ACCESS, unit_of_work
+from neo4j.exceptions import ClientError
 from dotenv import load_dotenv
 from langchain_core.tools import tool
+from threading import Lock
+from tools.cypher_guard import apply_result_limit, max_estimated_rows, normalize_query
 import os
 import json
 
 load_dotenv()
 
+# Guard settings for agent-generated Cypher (override in .env)
+QUERY_TIMEOUT_SECONDS = float(os.getenv("query_timeout_seconds", "10"))
+QUERY_MAX_ESTIMATED_ROWS = int(os.getenv("query_max_estimated_rows", "1000000"))
+QUERY_RESULT_LIMIT = int(os.getenv("query_result_limit", "100"))
+
+TIMEOUT_ERROR_CODES = (
+    "Neo.ClientError.Transaction.TransactionTimedOut",
+    "Neo.ClientError.Transaction.TransactionTimedOutClientConfiguration",
+)
+
+_metrics = {"executed": 0, "rejected": 0, "timed_out": 0, "auto_limited": 0, "failed": 0}
+_metrics_lock = Lock()
+
+
+def _count(metric: str):
+    with _metrics_lock:
+        _metrics[metric] += 1
+
+
+def get_query_metrics():
+    """Return a snapshot of the guard counters for the Cypher query tool"""
+    with _metrics_lock:
+        return dict(_metrics)
+
+
+def _guard_error(reason: str, message: str, **details) -> str:
+    """Structured error the agent can use to rewrite its query"""
+    return json.dumps({"error": message, "reason": reason, **details})
+
+
+@unit_of_work(timeout=QUERY_TIMEOUT_SECONDS)
+def _explain(tx, cypher_query: str):
+    summary = tx.run("EXPLAIN " + cypher_query).consume()
+    return summary.query_type, summary.plan
+
+
+@unit_of_work(timeout=QUERY_TIMEOUT_SECONDS)
+def _fetch(tx, cypher_query: str):
+    return [record.data() for record in tx.run(cypher_query)]
+
+WRITE_NOT_ALLOWED_HINT = "Remove CREATE/MERGE/SET/DELETE/CALL clauses that modify the graph."
+
+
 @tool
 def query(cypher_query: str) -> str:
-   
+    """
+    Run a read-only Cypher query against the movie graph.
+    Returns a JSON list of rows, {"rows", "truncated", "limit", "hint"} when the
+    result was cut to the row limit, or {"error", "reason", "hint"} when the
+    query was rejected or timed out.
+    """
+    if not cypher_query:
+        return json.dumps({"error": "No Cypher query provided."})
+
+    cypher_query, masked_query = normalize_query(cypher_query)
     if not cypher_query:
         return json.dumps({"error": "No Cypher query provided."})
 
@@ -19,18 +74,83 @@ def query(cypher_query: str) -> str:
         password = os.getenv("password")
         driver = GraphDatabase.driver(uri, auth=(user, password))
         
-        with driver.session() as session:
-            result = session.run(cypher_query)
-            data = [record.data() for record in result]
-        
-        driver.close()
+        try:
+            with driver.session(default_access_mode=READ_ACCESS) as session:
+                # Plan the query first so writes and runaway plans never execute
+                query_type, plan = session.execute_read(_explain, cypher_query)
+
+                if query_type != "r":
+                    _count("rejected")
+                    return _guard_error(
+                        "write_not_allowed",
+                        "Only read-only Cypher queries are allowed.",
+                        hint=WRITE_NOT_ALLOWED_HINT,
+                    )
+
+                estimated_rows = max_estimated_rows(plan)
+                if estimated_rows > QUERY_MAX_ESTIMATED_ROWS:
+                    _count("rejected")
+                    return _guard_error(
+                        "too_expensive",
+                        "Query plan exceeds the row budget.",
+                        estimated_rows=int(estimated_rows),
+                        max_estimated_rows=QUERY_MAX_ESTIMATED_ROWS,
+                        hint="Anchor the MATCH on an indexed property, avoid disconnected patterns and add a LIMIT.",
+                    )
+
+                cypher_query, action = apply_result_limit(cypher_query, masked_query, plan, QUERY_RESULT_LIMIT)
+                if action == "rejected":
+                    _count("rejected")
+                    return _guard_error(
+                        "unbounded_result",
+                        "Query may return too many rows and cannot be limited automatically.",
+                        max_rows=QUERY_RESULT_LIMIT,
+                        hint="End the query with RETURN ... LIMIT, or add a LIMIT to each UNION branch.",
+                    )
+                auto_limited = action == "limited"
+                if auto_limited:
+                    _count("auto_limited")
+
+                data = session.execute_read(_fetch, cypher_query)
+        finally:
+            driver.close()
         
+        _count("executed")
+
         if not data:
             return "No results found for this query."
         
+        if auto_limited and len(data) >= QUERY_RESULT_LIMIT:
+            # Tell the agent the rows are incomplete so it doesn't treat them as the full answer
+            return json.dumps({
+                "rows": data,
+                "truncated": True,
+                "limit": QUERY_RESULT_LIMIT,
+                "hint": "Results were cut to the limit. Use count() for totals, or add ORDER BY/LIMIT or narrow the MATCH.",
+            }, indent=2)
+        
         return json.dumps(data, indent=2)
 
+    except ClientError as e:
+        if e.code in TIMEOUT_ERROR_CODES:
+            _count("timed_out")
+            return _guard_error(
+                "timeout",
+                f"Query exceeded the {QUERY_TIMEOUT_SECONDS:g}s timeout.",
+                hint="Narrow the MATCH pattern or add a LIMIT.",
+            )
+        if e.code == "Neo.ClientError.Statement.AccessMode":
+            _count("rejected")
+            return _guard_error(
+                "write_not_allowed",
+                "Only read-only Cypher queries are allowed.",
+                hint=WRITE_NOT_ALLOWED_HINT,
+            )
+        _count("failed")
+        return json.dumps({"error": str(e)})
+
     except Exception as e:
+        _count("failed")
         return json.dumps({"error": str(e)})
 
 
@@ -41,12 +161,13 @@ def get_graph_schema_info():
     password = os.getenv("password")
     driver = GraphDatabase.driver(uri, auth=(user, password))
     
-    with driver.session() as session:
-        node_labels = session.run("CALL db.labels()").values()
-        relationship_types = session.run("CALL db.relationshipTypes()").values()
-        property_keys = session.run("CALL db.propertyKeys()").values()
-    
-    driver.close()
+    try:
+        with driver.session() as session:
+            node_labels = session.run("CALL db.labels()").values()
+            relationship_types = session.run("CALL db.relationshipTypes()").values()
+            property_keys = session.run("CALL db.propertyKeys()").values()
+    finally:
+        driver.close()
     
     return {
         "node_labels": [label[0] for label in node_labels],